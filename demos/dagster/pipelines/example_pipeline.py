@@ -1,36 +1,109 @@
 """
 Example Dagster solids and pipeline from the Dagster tutorial.
 """
-import csv
-from typing import Any, Dict, List
+import json
+import os
+import pickle
+from hashlib import sha256
+from pathlib import Path
+from tempfile import mkstemp
+from time import time
 
+import pandas as pd
 import requests
-from dagster import execute_pipeline, pipeline, solid
+from dagster import (
+    ModeDefinition,
+    execute_pipeline,
+    fs_io_manager,
+    in_process_executor,
+    multiprocess_executor,
+    pipeline,
+    solid,
+)
 from dagster.core.execution.context.compute import SolidExecutionContext
 
+CEREAL_DATA_URL = "https://docs.dagster.io/assets/cereal.csv"
+CACHE_DIR = Path.home() / ".cache" / "cereal"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+CACHE_VERSION = 1
+CSV_READ_OPTIONS = {
+    "usecols": ["name", "sugars"],
+    "dtype": {"name": "string", "sugars": "int16"},
+}
+
+
+def _cache_file(url: str) -> Path:
+    """Location of the local cache for data downloaded from a URL and parsed."""
+    cache_key = json.dumps(
+        [CACHE_VERSION, pd.__version__, url, CSV_READ_OPTIONS], sort_keys=True
+    )
+    return CACHE_DIR / f"{sha256(cache_key.encode()).hexdigest()}.pkl"
+
+
+def _write_cache(data: pd.DataFrame, cache_file: Path) -> None:
+    """Write data to the local cache without exposing a partially written file."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_file = mkstemp(dir=cache_file.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        data.to_pickle(tmp_file)
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        os.unlink(tmp_file)
+        raise
+
 
 @solid
-def download_data(context: SolidExecutionContext) -> List[Dict[str, Any]]:
-    """Download dataset."""
-    response = requests.get("https://docs.dagster.io/assets/cereal.csv")
-    lines = response.text.split("\n")
-    cereals = [row for row in csv.DictReader(lines)]
+def download_data(context: SolidExecutionContext) -> pd.DataFrame:
+    """Download dataset, unless a fresh copy is already in the local cache."""
+    cache_file = _cache_file(CEREAL_DATA_URL)
+    cache_is_fresh = (
+        cache_file.exists()
+        and time() - cache_file.stat().st_mtime < CACHE_TTL_SECONDS
+    )
+    cereals = None
+    if cache_is_fresh:
+        context.log.info(f"Loading cached data from {cache_file}")
+        try:
+            cereals = pd.read_pickle(cache_file)
+        except (
+            pickle.UnpicklingError,
+            AttributeError,
+            EOFError,
+            ImportError,
+            TypeError,
+        ):
+            context.log.warning(f"Could not read {cache_file}, downloading data")
+    if cereals is None:
+        with requests.get(CEREAL_DATA_URL, stream=True) as response:
+            response.raw.decode_content = True
+            cereals = pd.read_csv(response.raw, **CSV_READ_OPTIONS)
+        try:
+            _write_cache(cereals, cache_file)
+        except OSError:
+            context.log.warning(f"Could not write {cache_file}, data not cached")
     context.log.info(f"Found {len(cereals)} cereals")
     return cereals
 
 
 @solid
 def find_max_sugar_cereal(
-    context: SolidExecutionContext, cereals: List[Dict[str, Any]]
+    context: SolidExecutionContext, cereals: pd.DataFrame
 ) -> str:
     """Find the product that has the maximum value for sugar content"""
-    sorted_by_sugar = sorted(cereals, key=lambda cereal: cereal["sugars"])
-    max_sugar_cereal = sorted_by_sugar[-1]["name"]
+    max_sugar_cereal = cereals.loc[cereals["sugars"].idxmax(), "name"]
     context.log.info(f"{max_sugar_cereal} has the greatest amount of sugar.")
     return max_sugar_cereal
 
 
-@pipeline
+@pipeline(
+    mode_defs=[
+        ModeDefinition(
+            resource_defs={"io_manager": fs_io_manager},
+            executor_defs=[in_process_executor, multiprocess_executor],
+        )
+    ]
+)
 def cereal_data_pipeline() -> str:
     """Compose the end-to-end cereal data pipeline."""
     return find_max_sugar_cereal(download_data())
@@ -8,8 +8,4 @@ from pipelines.example_pipeline import cereal_data_pipeline
 
 @repository
 def team_one():
-    return {
-        "pipelines": {
-            "cereal_data_pipeline": lambda: cereal_data_pipeline
-        }
-    }
+    return [cereal_data_pipeline]
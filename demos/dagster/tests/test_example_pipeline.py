@@ -1,18 +1,28 @@
 """
 Unit tests for the example pipeline.
 """
-from io import BytesIO
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import Iterator
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
 from dagster import execute_pipeline, build_solid_context
 from dagster.core.execution.context.compute import SolidExecutionContext
 from pytest import fixture
 from requests import Response
 
-from pipelines.example_pipeline import cereal_data_pipeline, download_data
+from pipelines.example_pipeline import (
+    CEREAL_DATA_URL,
+    CSV_READ_OPTIONS,
+    _cache_file,
+    cereal_data_pipeline,
+    download_data,
+    find_max_sugar_cereal,
+)
 
 
-@fixture(scope="session")
+@fixture
 def test_data() -> BytesIO:
     with open("tests/test_data.csv", "r+b") as f:
         file_bytes = f.read()
@@ -24,18 +34,99 @@ def context() -> SolidExecutionContext:
     return build_solid_context()
 
 
+@fixture
+def cache_dir(tmp_path: Path) -> Iterator[Path]:
+    with patch("pipelines.example_pipeline.CACHE_DIR", tmp_path):
+        yield tmp_path
+
+
 @patch("pipelines.example_pipeline.requests")
 def test_download_data_downloads_data(
-    mock_requests: MagicMock, test_data: BytesIO, context: SolidExecutionContext
+    mock_requests: MagicMock,
+    test_data: BytesIO,
+    context: SolidExecutionContext,
+    cache_dir: Path,
+):
+    mock_response = Response()
+    mock_response.raw = test_data
+    mock_requests.get.return_value = mock_response
+    dataset = download_data(context)
+    assert len(dataset) == 77
+    assert list(dataset.columns) == ["name", "sugars"]
+
+
+@patch("pipelines.example_pipeline.requests")
+def test_download_data_uses_cached_data(
+    mock_requests: MagicMock,
+    test_data: BytesIO,
+    context: SolidExecutionContext,
+    cache_dir: Path,
+):
+    mock_response = Response()
+    mock_response.raw = test_data
+    mock_requests.get.return_value = mock_response
+    dataset = download_data(context)
+    cached_dataset = download_data(context)
+    assert mock_requests.get.call_count == 1
+    assert cached_dataset.equals(dataset)
+    assert list(cache_dir.glob("*.tmp")) == []
+
+
+@patch("pipelines.example_pipeline.requests")
+def test_download_data_downloads_data_when_cache_is_unreadable(
+    mock_requests: MagicMock,
+    test_data: BytesIO,
+    context: SolidExecutionContext,
+    cache_dir: Path,
 ):
+    _cache_file(CEREAL_DATA_URL).write_bytes(b"not a pickle")
     mock_response = Response()
     mock_response.raw = test_data
     mock_requests.get.return_value = mock_response
     dataset = download_data(context)
+    assert mock_requests.get.call_count == 1
     assert len(dataset) == 77
-    assert len(dataset[0].keys()) == 16
 
 
-def test_cereal_data_pipeline():
+@patch("pipelines.example_pipeline.requests")
+def test_download_data_returns_data_when_cache_is_unwritable(
+    mock_requests: MagicMock,
+    test_data: BytesIO,
+    context: SolidExecutionContext,
+    tmp_path: Path,
+):
+    not_a_dir = tmp_path / "not_a_dir"
+    not_a_dir.touch()
+    mock_response = Response()
+    mock_response.raw = test_data
+    mock_requests.get.return_value = mock_response
+    with patch("pipelines.example_pipeline.CACHE_DIR", not_a_dir / "cereal"):
+        dataset = download_data(context)
+    assert len(dataset) == 77
+
+
+def test_find_max_sugar_cereal_compares_sugars_numerically(
+    context: SolidExecutionContext,
+):
+    csv_data = StringIO("name,sugars\nNut&Honey Crunch,9\nSmacks,15\nCheerios,1\n")
+    cereals = pd.read_csv(csv_data, **CSV_READ_OPTIONS)
+    max_sugar_cereal = find_max_sugar_cereal(context, cereals)
+    assert max_sugar_cereal == "Smacks"
+
+
+def test_cereal_data_pipeline(cache_dir: Path):
+    result = execute_pipeline(cereal_data_pipeline)
+    assert result.success
+
+
+@patch("pipelines.example_pipeline.requests")
+def test_cereal_data_pipeline_runs_with_default_config(
+    mock_requests: MagicMock, test_data: BytesIO, cache_dir: Path
+):
+    mock_response = Response()
+    mock_response.raw = test_data
+    mock_requests.get.return_value = mock_response
     result = execute_pipeline(cereal_data_pipeline)
     assert result.success
+    solid_result = result.result_for_solid("find_max_sugar_cereal")
+    assert solid_result.output_value() in {"Golden Crisp", "Smacks"}
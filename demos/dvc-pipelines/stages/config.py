@@ -1,6 +1,23 @@
 """
 Pipeline stage configuration.
 """
-DATASET_FILENAME = "artefacts/dataset.csv"
+from typing import Any, Dict
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+DATASET_FILENAME = "artefacts/dataset.parquet"
 METRICS_FILENAME = "metrics/metrics.json"
-MODEL_FILENAME = "artefacts/model.joblib"
+MODEL_FILENAME = "artefacts/model.npz"
+PARAMS_FILENAME = "params.yaml"
+
+
+def get_params(stage: str) -> Dict[str, Any]:
+    """Get the parameters for a pipeline stage."""
+    with open(PARAMS_FILENAME) as f:
+        params = yaml.load(f, Loader=SafeLoader)
+    return params[stage]
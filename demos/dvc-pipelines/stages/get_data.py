@@ -4,14 +4,17 @@ Stage that gets a dataset for training a ML model.
 import numpy as np
 import pandas as pd
 
-from config import DATASET_FILENAME
+from config import DATASET_FILENAME, get_params
 
 
 def run_stage() -> None:
-    x = np.random.standard_normal(1000)
-    y = 2.0 * x + 0.1 * np.random.standard_normal(1000)
+    params = get_params("get_data")
+    rng = np.random.default_rng(params["seed"])
+    xy = rng.standard_normal((1000, 2))
+    x = xy[:, 0]
+    y = 2.0 * x + 0.1 * xy[:, 1]
     df = pd.DataFrame({"y": y, "x": x})
-    df.to_csv(DATASET_FILENAME, index=False)
+    df.to_parquet(DATASET_FILENAME, engine="pyarrow", compression="zstd")
 
 
 if __name__ == "__main__":
@@ -1,31 +1,49 @@
 """
 Train regression model on dataset
 """
-import joblib
 import json
-import pandas as pd
-import yaml
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_absolute_error
-from sklearn.model_selection import train_test_split
+from typing import Tuple
 
-from config import DATASET_FILENAME, METRICS_FILENAME, MODEL_FILENAME
+import numba
+import numpy as np
+
+from config import (
+    DATASET_FILENAME,
+    METRICS_FILENAME,
+    MODEL_FILENAME,
+    get_params,
+)
+
+
+@numba.njit(cache=True, fastmath=True)
+def fit_predict_mae(
+    x: np.ndarray, y: np.ndarray, split_idx: int
+) -> Tuple[np.ndarray, float]:
+    """Fit OLS on data before split_idx and return coefficients and test-set MAE."""
+    x_train, y_train = x[:split_idx], y[:split_idx]
+    x_mean, y_mean = x_train.mean(), y_train.mean()
+    x_dev = x_train - x_mean
+    slope = (x_dev * (y_train - y_mean)).sum() / (x_dev * x_dev).sum()
+    intercept = y_mean - slope * x_mean
+
+    y_test_pred = intercept + slope * x[split_idx:]
+    mae = np.abs(y[split_idx:] - y_test_pred).mean()
+    return np.array([intercept, slope]), mae
 
 
 def run_stage() -> None:
-    params = yaml.safe_load(open("params.yaml"))["train"]
-    data = pd.read_csv(DATASET_FILENAME)
-    X_train, X_test, y_train, y_test = train_test_split(
-        data[["x"]], data["y"], random_state=params["random_state"]
-    )
-    model = LinearRegression()
-    model.fit(X_train, y_train)
-    joblib.dump(model, MODEL_FILENAME)
-
-    y_test_pred = model.predict(X_test)
-    mae = mean_absolute_error(y_test, y_test_pred)
+    import pandas as pd
+
+    params = get_params("train")
+    data = pd.read_parquet(DATASET_FILENAME)
+    rng = np.random.default_rng(params["random_state"])
+    idx = rng.permutation(len(data))
+    x, y = data["x"].to_numpy()[idx], data["y"].to_numpy()[idx]
+
+    theta, mae = fit_predict_mae(x, y, int(0.75 * len(data)))
+    np.savez(MODEL_FILENAME, intercept=theta[0], coef=theta[1:])
     with open(METRICS_FILENAME, "w") as metrics_file:
-        json.dump({"MAE": mae}, metrics_file, indent=4)
+        json.dump({"MAE": float(mae)}, metrics_file, indent=4)
 
 
 if __name__ == "__main__":
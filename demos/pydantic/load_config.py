@@ -9,18 +9,23 @@ from pydantic import ValidationError
 
 from config_schema import ConfigV1
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def get_config(file: Path = Path.cwd() / "config.yaml") -> ConfigV1:
     """Get validated config as an instance of the data model."""
-    with open(file) as f:
-        raw_config: dict[str, Any] = yaml.safe_load(f)
+    with open(file, "rb") as f:
+        raw_config: dict[str, Any] = yaml.load(f, Loader=SafeLoader)
     return ConfigV1(**raw_config)
 
 
 def get_config_as_dict(file: Path = Path.cwd() / "config.yaml") -> dict[str, Any]:
     """Get config as a dictionary that has been validated against the data model."""
-    with open(file) as f:
-        raw_config: dict[str, Any] = yaml.safe_load(f)
+    with open(file, "rb") as f:
+        raw_config: dict[str, Any] = yaml.load(f, Loader=SafeLoader)
     ConfigV1.model_validate(raw_config)
     return raw_config
 